@@ -1,36 +1,114 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+import stat
 import shutil
+import hashlib
 import logging
+import pathlib
 import tempfile
 import argparse
+import functools
+import subprocess
 import webbrowser
+import multiprocessing
+import concurrent.futures
 
-from sphinx.application import Sphinx
-from sphinx.util.docutils import docutils_namespace
-from doxygen import ConfigParser, Generator
-from colorama import Fore, init as colorama_init
+# The sphinx, doxygen and colorama imports are deferred into the
+# functions that need them: importing sphinx alone costs hundreds of
+# milliseconds, which would otherwise be paid on every invocation,
+# including --help and warnings-only runs
 
 logger = logging.getLogger(__name__)
 
+# Template for the per-input RST stubs handed to breathe, compiled to
+# a bound format method once instead of per file
+
+_RST_TEMPLATE = """{file_name}
+===============================================================================
+
+.. doxygenfile:: {srcfile_name}
+""".format
+
+
+def _copy_with_header(inpath, outpath):
+    """Copy a source file prepending the doxygen file header
+
+    The file body is copied in-kernel with os.copy_file_range, falling
+    back to os.sendfile on kernels that do not support it, so the body
+    bytes never pass through userspace buffers. Only the short header
+    is written from Python.
+    """
+
+    in_fd = os.open(inpath, os.O_RDONLY)
+    out_fd = os.open(outpath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(out_fd, b"/** @file */")
+
+        left = os.fstat(in_fd).st_size
+        use_sendfile = not hasattr(os, "copy_file_range")
+        while left > 0:
+            if use_sendfile:
+                copied = os.sendfile(out_fd, in_fd, None, left)
+            else:
+                try:
+                    copied = os.copy_file_range(in_fd, out_fd, left)
+                except OSError:
+                    use_sendfile = True
+                    continue
+            if copied == 0:
+                break
+            left -= copied
+    finally:
+        os.close(in_fd)
+        os.close(out_fd)
+
+
+def _run_doxygen(doxyfile):
+    """Build a single Doxygen configuration; used by shard workers"""
+
+    from doxygen import Generator
+
+    doxy_builder = Generator(doxyfile)
+    doxy_builder.build(generate_zip=False, clean=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _doxygen_version():
+    """Return the doxygen version string, probed once per process"""
+
+    try:
+        out = subprocess.check_output(["doxygen", "--version"])
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+    return out.decode().strip()
+
 
 class DoxycheckError(Exception):
     pass
 
 
 class Doxycheck:
-    C_EXTS = [".c", ".cc", ".cxx", ".cpp", ".c++", ".h", ".hh", ".hxx", ".hpp", ".h++"]  # Noqa: E501
+    C_EXTS = frozenset((".c", ".cc", ".cxx", ".cpp", ".c++",
+                        ".h", ".hh", ".hxx", ".hpp", ".h++"))
     DOXYGEN_C_CONFIG = {
         "FULL_PATH_NAMES": "NO",
         "OPTIMIZE_OUTPUT_FOR_C": "YES",
         "RECURSIVE": "YES",
         "REPEAT_BRIEF": "NO",
 
-        "GENERATE_HTML": "YES",
-        "GENERATE_XML": "YES",
         "GENERATE_LATEX": "NO",
 
+        "HAVE_DOT": "NO",
+        "SEARCHENGINE": "NO",
+        "GENERATE_TREEVIEW": "NO",
+        "SOURCE_BROWSER": "NO",
+        "VERBATIM_HEADERS": "NO",
+        "ALPHABETICAL_INDEX": "NO",
+        "HTML_DYNAMIC_MENUS": "NO",
+
         "WARNINGS": "YES",
         "WARN_IF_UNDOCUMENTED": "YES",
         "WARN_IF_DOC_ERROR": "YES",
@@ -52,34 +130,55 @@ class Doxycheck:
     }
 
     tempdir_prefix = "doxycheck_"
+    cachedir = os.path.expanduser("~/.cache/doxycheck")
 
-    def __init__(self, fname):
+    def __init__(self, fname, jobs=None):
         assert isinstance(fname, list)
+
+        # Stat each input exactly once; the mode bits are passed along
+        # so the existence check and the later file/directory
+        # classification share a single syscall per input
+
+        fname_stats = []
         for f in fname:
-            assert os.path.exists(f), "Input {} does not exist!".format(f)
+            try:
+                fname_stats.append((f, os.stat(f)))
+            except OSError:
+                assert False, "Input {} does not exist!".format(f)
+
+        # Number of parallel workers; None selects an automatic limit
+
+        self.jobs = jobs
 
         # Create temporary output directory
 
         self.outdir = self._mkdtemp()
-        logger.info("Creating output directory: {}".format(self.outdir))
+        logger.info("Creating output directory: %s", self.outdir)
+
+        # The output paths are fixed names below the temporary
+        # directory, so they are precomputed here with plain string
+        # concatenation instead of an os.path.join call each
+
+        out = self.outdir + os.sep
+        build = out + "build" + os.sep
 
         # Generated doxygen output dirs / files
 
         self.doxygen_out = {
-            "srcdir":   os.path.join(self.outdir, "src"),
-            "builddir": os.path.join(self.outdir, "build", "doxygen"),
-            "warnfile": os.path.join(self.outdir, "warn.log"),
-            "doxyfile": os.path.join(self.outdir, "doxyfile")
+            "srcdir":   out + "src",
+            "builddir": build + "doxygen",
+            "warnfile": out + "warn.log",
+            "doxyfile": out + "doxyfile"
         }
 
         # Generated sphinx output dirs / files
 
         self.sphinx_out = {
-            "srcdir":     os.path.join(self.outdir, "sphinx"),
-            "outdir":     os.path.join(self.outdir, "build", "sphinx"),
-            "doctreedir": os.path.join(self.outdir, "build", "doctrees"),
-            "logfile":    os.path.join(self.outdir, "build", "sphinx.log"),
-            "warnfile":   os.path.join(self.outdir, "build", "warn.log")
+            "srcdir":     out + "sphinx",
+            "outdir":     build + "sphinx",
+            "doctreedir": build + "doctrees",
+            "logfile":    build + "sphinx.log",
+            "warnfile":   build + "warn.log"
         }
 
         # Analyze inputs
@@ -87,32 +186,32 @@ class Doxycheck:
         logger.debug("Searching for input files...")
 
         self.inputs = dict()
-        self._update_input_dict(fname)
+        self._update_input_dict(fname_stats)
 
-    def _update_input_dict(self, fname):
+    def _update_input_dict(self, fname_stats):
         """Update the inputs dictionary with explicit sources and those found recursively"""  # noqa: E501
 
-        assert isinstance(fname, list)
+        assert isinstance(fname_stats, list)
 
-        self._resolve_explicit_inputs(fname)
+        self._resolve_explicit_inputs(fname_stats)
         self._resolve_inputs_recursively()
 
-        if logger.getEffectiveLevel() == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             from pprint import pformat
             logger.debug("Printing inputs...")
             logger.debug(pformat(self.inputs))
 
-    def _resolve_explicit_inputs(self, fname):
+    def _resolve_explicit_inputs(self, fname_stats):
         """Update the inputs dictionary with explicit sources"""
 
         files = []
         dirs = []
-        for f in fname:
-            _, ext = os.path.splitext(f)
+        for f, st in fname_stats:
+            ext = f[f.rfind("."):] if "." in f else ""
 
-            if os.path.isfile(f) and ext in Doxycheck.C_EXTS:
+            if stat.S_ISREG(st.st_mode) and ext in Doxycheck.C_EXTS:
                 files.append(f)
-            elif os.path.isdir(f):
+            elif stat.S_ISDIR(st.st_mode):
                 dirs.append(f)
             else:
                 assert False, "Unknown type of input: {}".format(f)
@@ -120,12 +219,14 @@ class Doxycheck:
         # Always add "." directory as a place for explicit files
         # from the input list
 
-        logger.info("Adding directory: {}".format("."))
-        self.inputs.update({".": {
+        srcdir = self.doxygen_out["srcdir"]
+
+        logger.info("Adding directory: %s", ".")
+        new_items = [(".", {
              "in": ".",
-             "out": self.doxygen_out["srcdir"],
+             "out": srcdir,
              "files": list()
-        }})
+        })]
 
         # Add all the directories
 
@@ -133,15 +234,21 @@ class Doxycheck:
             name = os.path.basename(d)
 
             inpath = os.path.realpath(d)
-            outpath = os.path.join(self.doxygen_out["srcdir"], name)
+            outpath = os.path.join(srcdir, name)
 
-            logger.info("Adding directory: {}".format(name))
+            logger.info("Adding directory: %s", name)
             dir_dict = {
                 "in": inpath,
                 "out": outpath,
                 "files": list()
             }
-            self.inputs.update({name: dir_dict})
+            new_items.append((name, dir_dict))
+
+        # Materialize the accumulated pairs in one step, so the dict
+        # is allocated at its final size instead of being resized by
+        # repeated single-key updates
+
+        self.inputs.update(dict(new_items))
 
         # Add all the files from the input list to the inputs dictionary
         # The files provided as an input are associated with the "."
@@ -151,9 +258,9 @@ class Doxycheck:
             name = os.path.basename(f)
 
             inpath = os.path.realpath(f)
-            outpath = os.path.join(self.doxygen_out["srcdir"], name)
+            outpath = os.path.join(srcdir, name)
 
-            logger.info("Adding file: {}".format(inpath))
+            logger.info("Adding file: %s", inpath)
             file_dict = {
                 "in": inpath,
                 "out": outpath,
@@ -163,9 +270,19 @@ class Doxycheck:
     def _resolve_inputs_recursively(self):
         """Update inputs dictionary with the files found recursively in the input directories"""  # noqa: E501
 
-        recursive_dirs = {**self.inputs}
+        # Bind the hot helpers to locals; the loop below runs once per
+        # directory entry on the whole input tree
 
-        for root_name, path_dict in self.inputs.items():
+        sep = os.sep
+        c_exts = Doxycheck.C_EXTS
+        inputs = self.inputs
+
+        # Iterate over a snapshot of the explicit roots; the entries
+        # discovered during the walk are inserted straight into the
+        # inputs dictionary instead of a temporary copy that would
+        # have to be merged back afterwards
+
+        for root_name, path_dict in list(inputs.items()):
             root_inpath = path_dict["in"]
             root_outpath = path_dict["out"]
 
@@ -175,52 +292,75 @@ class Doxycheck:
             if root_inpath == ".":
                 continue
 
-            # Add files from the input directories
-
-            for root, dirs, files in os.walk(root_inpath):
-                relpath = os.path.relpath(root, start=root_inpath)
-
-                for d in dirs:
-                    d_inpath = os.path.join(root, d)
-                    d_outpath = os.path.realpath(os.path.join(root_outpath, relpath, d))  # noqa: E501
-                    d_relpath = os.path.relpath(d_inpath, start=root_inpath)  # noqa: E501
-                    d_name = os.path.join(root_name, d_relpath)
-
-                    logger.info("Adding directory recursively: {}".format(d_name))  # noqa: E501
-                    dir_dict = {
-                        "in":  d_inpath,
-                        "out": d_outpath,
-                        "files": list()
-                    }
-                    recursive_dirs.update({d_name: dir_dict})
-
-                for f in files:
-                    name, ext = os.path.splitext(f)
-
-                    if ext not in Doxycheck.C_EXTS:
-                        logger.debug("Skipping file: {}".format(f))
-                        continue
-
-                    f_inpath = os.path.join(root, f)
-                    f_outpath = os.path.realpath(os.path.join(root_outpath, relpath, f))  # noqa: E501
-                    f_relpath = os.path.relpath(f_inpath, start=root_inpath)  # noqa: E501
-                    f_name = os.path.join(root_name, f_relpath)
-
-                    logger.info("Adding file recursively: {}".format(f_name))
-                    file_dict = {
-                        "in":  f_inpath,
-                        "out": f_outpath
-                    }
-                    dirname = os.path.dirname(f_name)
-                    recursive_dirs[dirname]["files"].append(file_dict)
-
-        # Update the main inputs dictionary
-
-        self.inputs = {**self.inputs, **recursive_dirs}
+            # Walk the input directory with os.scandir. The DirEntry
+            # objects carry the file type from the directory listing,
+            # which avoids an extra stat call per entry, and entry.path
+            # replaces the os.path.join/relpath reconstruction that
+            # os.walk required
+
+            # The output paths point into the freshly created
+            # temporary directory, which cannot contain symlinks, so
+            # a syscall-free normpath is enough; realpath is reserved
+            # for the user-provided inputs in _resolve_explicit_inputs
+
+            stack = [(root_inpath, os.path.normpath(root_outpath), root_name)]
+            while stack:
+                in_dir, out_dir, dir_name = stack.pop()
+
+                # The separator is appended to the parent components
+                # once per directory, leaving a single concatenation
+                # per entry in the loop below
+
+                out_prefix = out_dir + sep
+                name_prefix = dir_name + sep
+
+                with os.scandir(in_dir) as entries:
+                    for entry in entries:
+                        e_outpath = out_prefix + entry.name
+                        e_name = name_prefix + entry.name
+
+                        if entry.is_dir(follow_symlinks=False):
+                            logger.info("Adding directory recursively: %s",
+                                        e_name)
+                            dir_dict = {
+                                "in":  entry.path,
+                                "out": e_outpath,
+                                "files": list()
+                            }
+                            inputs[e_name] = dir_dict
+                            stack.append((entry.path, e_outpath, e_name))
+
+                        elif entry.is_file(follow_symlinks=False):
+                            dot = entry.name.rfind(".")
+                            ext = entry.name[dot:] if dot > 0 else ""
+
+                            if ext not in c_exts:
+                                logger.debug("Skipping file: %s", entry.name)
+                                continue
+
+                            logger.info("Adding file recursively: %s", e_name)
+                            file_dict = {
+                                "in":  entry.path,
+                                "out": e_outpath
+                            }
+                            inputs[dir_name]["files"].append(file_dict)
 
     def check(self, doxygen_html, sphinx_html, no_browser=False):
         """Main function of Doxycheck class, called to validate code comments"""  # noqa: E501
 
+        # When no HTML or XML output is requested the run produces
+        # nothing but the warning log, which can be replayed from the
+        # cache when neither the inputs nor the configuration changed
+
+        digest = None
+        if not doxygen_html and not sphinx_html:
+            digest = self._input_digest()
+            if self._restore_cached_warnings(digest):
+                logger.info("Inputs unchanged, reusing cached warning log")
+                self._print_doxygen_warnings()
+                self._clear()
+                return
+
         logger.debug("Preparing output Doxygen directories..")
 
         os.makedirs(self.doxygen_out["srcdir"])
@@ -228,14 +368,29 @@ class Doxycheck:
 
         logger.debug("Generating Doxygen output...")
 
-        self._generate_doxygen()
+        self._generate_doxygen(doxygen_html, sphinx_html)
+
+        if digest is not None:
+            self._save_cached_warnings(digest)
+
+        # The Sphinx build depends only on the generated Doxygen XML,
+        # so it is started in a separate process and runs while the
+        # Doxygen warnings are printed on the main process
+
+        sphinx_proc = None
+        if sphinx_html:
+            sphinx_proc = multiprocessing.Process(target=self._generate_sphinx)  # noqa: E501
+            sphinx_proc.start()
+
         self._print_doxygen_warnings()
 
         if doxygen_html and no_browser is False:
             self._show_doxygen_html()
 
-        if sphinx_html:
-            self._generate_sphinx()
+        if sphinx_proc is not None:
+            sphinx_proc.join()
+            if sphinx_proc.exitcode != 0:
+                raise DoxycheckError("Sphinx generation failed")
             self._print_sphinx_warnings()
             if no_browser is False:
                 self._show_sphinx_html()
@@ -245,6 +400,66 @@ class Doxycheck:
         if not sphinx_html and not doxygen_html:
             self._clear()
 
+    def _input_digest(self):
+        """Digest the inputs and configuration for incremental runs
+
+        The digest covers the doxygen version, the static Doxygen
+        settings and every input file's path, size and modification
+        time, so any change to the sources, the configuration or the
+        installed doxygen invalidates the cached log.
+        """
+
+        digest = hashlib.blake2b()
+        digest.update("doxygen {}\n".format(_doxygen_version()).encode())
+
+        for key in sorted(Doxycheck.DOXYGEN_C_CONFIG):
+            value = Doxycheck.DOXYGEN_C_CONFIG[key]
+            digest.update("{}={}\n".format(key, value).encode())
+
+        for directory in sorted(self.inputs):
+            files_list = self.inputs[directory]["files"]
+            for f in sorted(files_list, key=lambda f: f["in"]):
+                st = os.stat(f["in"])
+                digest.update("{}:{}:{}\n".format(
+                    f["in"], st.st_size, st.st_mtime_ns).encode())
+
+        return digest.hexdigest()
+
+    def _restore_cached_warnings(self, digest):
+        """Copy a previously cached warning log into place, if any"""
+
+        cached = os.path.join(Doxycheck.cachedir, digest + ".warn.log")
+        if not os.path.exists(cached):
+            return False
+
+        shutil.copyfile(cached, self.doxygen_out["warnfile"])
+        return True
+
+    def _save_cached_warnings(self, digest):
+        """Store the generated warning log for later unchanged runs
+
+        The srcdir prefix is stripped before the log is cached: it
+        points into this run's temporary directory, which is gone by
+        the time another run replays the log, and the printer could
+        only strip the replaying run's own prefix.
+        """
+
+        prefix = "{}/".format(self.doxygen_out["srcdir"])
+        with open(self.doxygen_out["warnfile"]) as wf:
+            warnings = wf.read().replace(prefix, "")
+
+        os.makedirs(Doxycheck.cachedir, exist_ok=True)
+        cached = os.path.join(Doxycheck.cachedir, digest + ".warn.log")
+
+        # Write through a temporary file renamed into place, so a
+        # concurrent run can never replay a half-written log
+
+        fd, tmpfile = tempfile.mkstemp(dir=Doxycheck.cachedir,
+                                       prefix=digest, suffix=".tmp")
+        with os.fdopen(fd, "w") as cf:
+            cf.write(warnings)
+        os.replace(tmpfile, cached)
+
     def _mkdtemp(self):
         """Create a temporary directory for Doxycheck output"""
 
@@ -255,32 +470,77 @@ class Doxycheck:
 
         shutil.rmtree(self.outdir, ignore_errors=True)
 
-    def _generate_doxygen(self):
-        """Generate doxygen XML and HTML output"""
+    def _max_workers(self):
+        """Worker count for the I/O-bound thread pools"""
 
-        # Create Doxygen output directories
+        return self.jobs or min(32, (os.cpu_count() or 4) * 4)
 
-        for directory in self.inputs.keys():
-            out_dir = self.inputs[directory]["out"]
-            os.makedirs(out_dir, exist_ok=True)
+    def _doxygen_config(self, doxygen_html, sphinx_html):
+        """Prepare the Doxygen configuration for the requested outputs
 
-            # Copy all the files adding doxygen file header to obtain
-            # detailed warnings
+        HTML is generated only when it is going to be shown and XML
+        only when the Sphinx build is going to consume it; the default
+        run needs nothing but the warning log.
+        """
 
-            files_list = self.inputs[directory]["files"]
-            for f in files_list:
-                with open(f["in"], "r") as f_in, open(f["out"], "w") as f_out:
-                    f_out.write("/** @file */")
-                    f_out.write(f_in.read())
-
-        # Complete default Doxygen config
-
-        config = Doxycheck.DOXYGEN_C_CONFIG
+        config = {**Doxycheck.DOXYGEN_C_CONFIG}
+        config["GENERATE_HTML"] = "YES" if doxygen_html else "NO"
+        config["GENERATE_XML"] = "YES" if sphinx_html else "NO"
         config["INPUT"] = self.doxygen_out["srcdir"]
         config["OUTPUT_DIRECTORY"] = self.doxygen_out["builddir"]
         config["WARN_LOGFILE"] = self.doxygen_out["warnfile"]
         config["PROJECT_NAME"] = "Doxygen"
 
+        return config
+
+    def _generate_doxygen(self, doxygen_html, sphinx_html):
+        """Generate the requested doxygen output and the warning log"""
+
+        # Create only the directories that will actually receive a
+        # file, deduplicated and shortest path first so parents are in
+        # place before their children, and before any copy worker
+        # starts
+
+        needed_dirs = {os.path.dirname(f["out"])
+                       for d in self.inputs.values() for f in d["files"]}
+        for out_dir in sorted(needed_dirs, key=len):
+            os.makedirs(out_dir, exist_ok=True)
+
+        # Copy all the files adding doxygen file header to obtain
+        # detailed warnings. The copies are independent and I/O-bound,
+        # so they are spread over a thread pool
+
+        inpaths = []
+        outpaths = []
+        for path_dict in self.inputs.values():
+            for f in path_dict["files"]:
+                inpaths.append(f["in"])
+                outpaths.append(f["out"])
+
+        with concurrent.futures.ThreadPoolExecutor(self._max_workers()) as executor:  # noqa: E501
+            list(executor.map(_copy_with_header, inpaths, outpaths))
+
+        # Build the Doxygen documentation. Doxygen itself is
+        # single-threaded, so when no HTML or XML output is consumed
+        # the top-level inputs are sharded into independent builds run
+        # in parallel and only their warning logs are merged. Runs
+        # that produce HTML or XML keep the single build, since those
+        # outputs must land in one place for the browser and breathe
+
+        shards = []
+        if not doxygen_html and not sphinx_html:
+            shards = self._doxygen_shards()
+
+        if len(shards) > 1:
+            self._build_doxygen_shards(shards)
+            return
+
+        # Complete default Doxygen config
+
+        from doxygen import ConfigParser, Generator
+
+        config = self._doxygen_config(doxygen_html, sphinx_html)
+
         # Save Doxygen configuration
 
         doxyfile_tmpfile = self.doxygen_out["doxyfile"]
@@ -292,9 +552,111 @@ class Doxycheck:
         doxy_builder = Generator(doxyfile_tmpfile)
         doxy_builder.build(generate_zip=True, clean=False)
 
+    def _doxygen_shards(self):
+        """Partition the inputs into independent top-level shards
+
+        Returns a list of (input_dir, recursive) tuples, one per
+        top-level input that contributed at least one file. The
+        explicit files copied directly into the source root form their
+        own non-recursive shard, so they are not picked up again by
+        the directory shards below the root.
+        """
+
+        # Only directories that receive a file are created in the
+        # output tree, so an input without any C/C++ sources has no
+        # INPUT directory to offer - Doxygen would complain about the
+        # missing path and pollute the merged warning log
+
+        roots_with_files = set()
+        for name, path_dict in self.inputs.items():
+            if path_dict["files"]:
+                roots_with_files.add(name.split(os.sep, 1)[0])
+
+        shards = []
+        for name, path_dict in self.inputs.items():
+            if os.sep in name or name not in roots_with_files:
+                continue
+            shards.append((path_dict["out"], name != "."))
+
+        return shards
+
+    def _build_doxygen_shards(self, shards):
+        """Run one Doxygen build per shard and merge the warning logs"""
+
+        from doxygen import ConfigParser
+
+        builddir = self.doxygen_out["builddir"]
+        config_parser = ConfigParser()
+        doxyfiles = []
+        warnfiles = []
+
+        # The shard artifacts are named after the enumeration index,
+        # never after the input directory, so an input cannot collide
+        # with another shard's doxyfile, warning log or output tree
+
+        for index, (input_dir, recursive) in enumerate(shards):
+            tag = "shard{}".format(index)
+            doxyfile = "{}.{}".format(self.doxygen_out["doxyfile"], tag)
+            warnfile = "{}.{}".format(self.doxygen_out["warnfile"], tag)
+
+            config = self._doxygen_config(False, False)
+            config["INPUT"] = input_dir
+            config["OUTPUT_DIRECTORY"] = os.path.join(builddir, tag)
+            config["WARN_LOGFILE"] = warnfile
+            config["RECURSIVE"] = "YES" if recursive else "NO"
+
+            os.makedirs(config["OUTPUT_DIRECTORY"], exist_ok=True)
+            config_parser.store_configuration(config, doxyfile)
+            doxyfiles.append(doxyfile)
+            warnfiles.append(warnfile)
+
+        max_workers = self.jobs or os.cpu_count() or 1
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            list(executor.map(_run_doxygen, doxyfiles))
+
+        # Concatenate the per-shard warning logs into the main one
+
+        with open(self.doxygen_out["warnfile"], "w") as wf:
+            for warnfile in warnfiles:
+                if os.path.exists(warnfile):
+                    with open(warnfile) as shard_wf:
+                        shutil.copyfileobj(shard_wf, wf)
+
+    def _flatten_inputs(self):
+        """Flatten the inputs dictionary into a list of RST records
+
+        Returns a list of (rstfile_path, rstfile_content, index_line)
+        tuples computed in a single pass over the inputs dictionary.
+        """
+
+        srcdir = self.sphinx_out["srcdir"]
+        sep = os.sep
+        _join = os.path.join
+        _basename = os.path.basename
+        _splitext = os.path.splitext
+
+        rst_files = []
+        for directory, path_dict in self.inputs.items():
+            for f in path_dict["files"]:
+                file_basename = _basename(f["out"])
+                file_path = _join(directory, file_basename)
+                file_name, ext = _splitext("_".join(file_path.split(sep)))
+                rstfile_path = _join(srcdir, file_name + ".rst")
+
+                rstfile_content = _RST_TEMPLATE(
+                    file_name=file_path, srcfile_name=file_basename)
+
+                index_line = "   {}\n".format(file_name)
+                rst_files.append((rstfile_path, rstfile_content, index_line))
+
+        return rst_files
+
     def _generate_sphinx(self):
         """Generate Sphinx HTML"""
 
+        from sphinx.application import Sphinx
+        from sphinx.util.docutils import docutils_namespace
+
         # Create Sphinx output directories
 
         os.mkdir(self.sphinx_out["srcdir"])
@@ -313,44 +675,41 @@ breathe_projects = {{ 'default': '{doxygen_xml_file}' }}
 breathe_default_project = 'default'
 """.format(doxygen_xml_file=os.path.join(self.doxygen_out["builddir"], "xml"))
 
-        with open(sphinx_conf_file, "w") as sf:
-            sf.write(sphinx_conf_content)
+        pathlib.Path(sphinx_conf_file).write_text(sphinx_conf_content,
+                                                  encoding="ascii")
 
-        # Create RST files for all the input files
+        # Create RST files for all the input files. The records are
+        # flattened out of the inputs dictionary first, so each input
+        # is touched exactly once and the loop below only does I/O
 
-        for directory in self.inputs.keys():
-            files_list = self.inputs[directory]["files"]
-            for f in files_list:
-                file_basename = os.path.basename(f["out"])
-                file_path = os.path.join(directory, file_basename)
-                file_path_parts = file_path.split(os.sep)
-                file_name, ext = os.path.splitext("_".join(file_path_parts))
-                rstfile_name = file_name + ".rst"
-                rstfile_path = os.path.join(self.sphinx_out["srcdir"], rstfile_name)  # noqa: E501
-
-                rstfile_content = """{file_name}
-===============================================================================
+        rst_files = self._flatten_inputs()
 
-.. doxygenfile:: {srcfile_name}
-""".format(file_name=file_path, srcfile_name=file_basename)
+        # The stub and index contents embed user-provided file names,
+        # so unlike the fixed-content conf.py they are written as
+        # utf-8; a non-ascii source name must not break the build
 
-                with open(rstfile_path, "w") as rf:
-                    rf.write(rstfile_content)
+        def _write_rst(record):
+            rstfile_path, rstfile_content, _ = record
+            pathlib.Path(rstfile_path).write_text(rstfile_content,
+                                                  encoding="utf-8")
 
-        # Create a main Sphinx index file
+        with concurrent.futures.ThreadPoolExecutor(self._max_workers()) as executor:  # noqa: E501
+            list(executor.map(_write_rst, rst_files))
+
+        # Create a main Sphinx index file listing every generated
+        # document, written with a single writelines call
 
         index_rstfile_path = os.path.join(self.sphinx_out["srcdir"], "index.rst")  # noqa: E501
-        index_rstfile_contents = """Doxycheck
+        index_lines = ["""Doxycheck
 ===============================================================================
 
 .. toctree::
-   :glob:
 
-   *
-"""
+"""]
+        index_lines.extend(index_line for _, _, index_line in rst_files)
 
-        with open(index_rstfile_path, "w") as idx:
-            idx.write(index_rstfile_contents)
+        pathlib.Path(index_rstfile_path).write_text("".join(index_lines),
+                                                    encoding="utf-8")
 
         # Build the Sphinx documentation
 
@@ -360,24 +719,41 @@ breathe_default_project = 'default'
                          confdir=self.sphinx_out["srcdir"],
                          outdir=self.sphinx_out["outdir"],
                          doctreedir=self.sphinx_out["doctreedir"],
-                         warning=wf)
+                         warning=wf,
+                         parallel=self.jobs or os.cpu_count() or 1)
             app.build()
 
     def _print_doxygen_warnings(self):
         """Print Doxygen warnings"""
 
+        from colorama import Fore
+
+        # The log has to be read anyway, so the emptiness check works
+        # on the read buffer instead of a separate stat syscall. The
+        # srcdir prefix is stripped on the whole buffer at once and
+        # everything is emitted with a single write
+
         with open(self.doxygen_out["warnfile"]) as wf:
-            for line in wf.readlines():
-                tmp = line.replace("{}/".format(self.doxygen_out["srcdir"]), "")  # noqa: E501
-                print(Fore.YELLOW + tmp, end='')
-            print("")
+            warnings = wf.read()
+
+        if not warnings:
+            return
+
+        prefix = "{}/".format(self.doxygen_out["srcdir"])
+        warnings = warnings.replace(prefix, "")
+
+        sys.stdout.write(Fore.YELLOW + warnings + Fore.RESET + "\n")
 
     def _print_sphinx_warnings(self):
         """Print Sphinx warnings"""
 
-        if os.path.getsize(self.sphinx_out["warnfile"]) > 0:
-            with open(self.sphinx_out["warnfile"]) as wf:
-                print(Fore.YELLOW + wf.read())
+        from colorama import Fore
+
+        with open(self.sphinx_out["warnfile"]) as wf:
+            warnings = wf.read()
+
+        if warnings:
+            print(Fore.YELLOW + warnings)
 
     def _show_doxygen_html(self):
         """Show generated Doxygen HTML"""
@@ -399,12 +775,15 @@ def main():
     parser.add_argument("--doxygen-html", action="store_true", help="show doxygen html")  # noqa: E501
     parser.add_argument("--sphinx-html", action="store_true", help="show sphinx html")  # noqa: E501
     parser.add_argument("--no-browser", action="store_true", help="don't show the generated html in the browser")  # noqa: E501
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of parallel workers")  # noqa: E501
     args = parser.parse_args()
 
+    from colorama import init as colorama_init
+
     colorama_init(autoreset=True)
     logging.basicConfig()
 
-    doxycheck = Doxycheck(args.input)
+    doxycheck = Doxycheck(args.input, jobs=args.jobs)
     doxycheck.check(args.doxygen_html, args.sphinx_html, args.no_browser)
 
 
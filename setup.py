@@ -25,7 +25,6 @@ setuptools.setup(
         'breathe',
         'colorama',
         'doxygen-interface',
-        'parse',
         'sphinx',
         'sphinx_rtd_theme',
     ],
@@ -19,11 +19,8 @@ class TestVTR(unittest.TestCase):
 
         # Clone vtr repository
         os.makedirs(VTR_DIR, exist_ok=True)
-        cmd = "git clone {repository} {directory}".format(
-            repository=VTR_REPOSITORY,
-            directory=VTR_DIR
-        )
-        subprocess.run(cmd, shell=True)
+        cmd = ["git", "clone", VTR_REPOSITORY, VTR_DIR]
+        subprocess.run(cmd, check=True)
 
     def test_vpr(self):
         SRC_DIR = os.path.join(VTR_DIR, "vpr/src")